@@ -21,6 +21,10 @@ from typing import Optional
 from .transport import OBDTransport
 from ..core import ThreadManager
 
+# Adapter replies carry echo, spaces, CR/LF and the '>' prompt around the
+# hex payload. Compiled once: _request_rpm runs at the polling rate.
+_NON_HEX_RE = re.compile(r'[^0-9A-Fa-f]')
+
 @dataclass
 class OBDResponse:
     """OBD response data structure"""
@@ -167,7 +171,7 @@ class OBDProtocol:
                 
             if len(response) >= 8 and response.startswith('41'):
                 # Strip whitespace and non-hex characters (echo, \r\n, prompts)
-                hex_str = re.sub(r'[^0-9A-Fa-f]', '', response)
+                hex_str = _NON_HEX_RE.sub('', response)
                 if len(hex_str) < 8:
                     return None
                 data = bytes.fromhex(hex_str)
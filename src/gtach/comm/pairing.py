@@ -12,6 +12,7 @@ Handles device discovery, pairing, and connection testing.
 """
 
 import logging
+import re
 import threading
 import time
 import signal
@@ -34,6 +35,14 @@ except ImportError:
 from ..display.setup_models import BluetoothDevice, PairingStatus, DeviceType
 from ..utils import ConfigManager
 
+# Name patterns consulted by BluetoothPairing._classify_device, fused into
+# one alternation so a name is scanned once rather than once per pattern.
+_NUMERIC_NAME_RE = re.compile(
+    r'-\d{4}'        # Pattern like "OBDII-1234" or "BT-5678"
+    r'|V\d+\.\d+'    # Version patterns like "V1.5" or "V2.1"
+    r'|^\d{6}$'      # 6-digit numbers (common in cheap ELM327 devices)
+)
+
 class BluetoothPairing:
     """Manages Bluetooth device discovery and pairing operations with timeout protection"""
     
@@ -277,16 +286,8 @@ class BluetoothPairing:
         
         # Check for numeric patterns that might indicate ELM327 devices
         # Many generic ELM327 devices use patterns like "OBDII-1234" or "BT-1234"
-        import re
-        numeric_patterns = [
-            r'.*-\d{4}',  # Pattern like "OBDII-1234" or "BT-5678"
-            r'V\d+\.\d+',  # Version patterns like "V1.5" or "V2.1"
-            r'^\d{6}$',    # 6-digit numbers (common in cheap ELM327 devices)
-        ]
-        
-        for pattern in numeric_patterns:
-            if re.search(pattern, name_upper):
-                return DeviceType.POSSIBLY_COMPATIBLE
+        if _NUMERIC_NAME_RE.search(name_upper):
+            return DeviceType.POSSIBLY_COMPATIBLE
         
         return DeviceType.UNKNOWN
     
@@ -19,6 +19,11 @@ import time
 import threading
 from typing import Optional, List, Tuple, Dict
 
+# Scan output parsers, compiled once at import: the MAC column of
+# hcitool scan, and bluetoothctl's "[NEW] Device <MAC> <name>" lines.
+_MAC_RE = re.compile(r'^[0-9A-Fa-f:]{17}$')
+_NEW_DEVICE_RE = re.compile(r'\[NEW\]\s+Device\s+([0-9A-Fa-f:]{17})\s+(.+)')
+
 
 class SystemBluetoothError(Exception):
     pass
@@ -126,7 +131,6 @@ class SystemBluetoothManager:
         """
         self.logger.info(f"Starting device discovery for {duration} seconds")
         devices = {}
-        mac_re = re.compile(r'^[0-9A-Fa-f:]{17}$')
 
         try:
             result = subprocess.run(
@@ -141,7 +145,7 @@ class SystemBluetoothManager:
                 if len(parts) >= 2:
                     mac = parts[0].strip()
                     name = parts[1].strip()
-                    if mac_re.match(mac):
+                    if _MAC_RE.match(mac):
                         devices[mac] = name
                         self.logger.debug(f"Found: {name} ({mac})")
 
@@ -160,7 +164,6 @@ class SystemBluetoothManager:
     def _discover_via_bluetoothctl(self, duration: int) -> dict:
         """Fallback: parse live bluetoothctl scan output."""
         devices = {}
-        dev_re = re.compile(r'\[NEW\]\s+Device\s+([0-9A-Fa-f:]{17})\s+(.+)')
         try:
             process = subprocess.Popen(
                 ['bluetoothctl'],
@@ -175,7 +178,7 @@ class SystemBluetoothManager:
 
             def _reader():
                 for line in process.stdout:
-                    m = dev_re.search(line)
+                    m = _NEW_DEVICE_RE.search(line)
                     if m and m.group(1) not in devices:
                         devices[m.group(1)] = m.group(2).strip()
                         self.logger.debug(f"btctl found: {m.group(2).strip()} ({m.group(1)})")
@@ -116,8 +116,14 @@ class OBDTransport(ABC):
             raise TypeError(
                 "OBDTransport is abstract and cannot be instantiated"
             )
+        # Resolved once: send_command runs on every poll, and getLogger
+        # takes the logging module lock on each call.
+        self.logger = logging.getLogger(self.__class__.__name__)
         self._shutdown = threading.Event()
-        self._lock = threading.RLock()
+        # Plain Lock: no method re-enters it. Paths that need the lock
+        # around a discard call _discard_handle_locked, not
+        # _discard_handle.
+        self._lock = threading.Lock()
         self._handle = None
         self._state = TransportState.DISCONNECTED
 
@@ -192,7 +198,7 @@ class OBDTransport(ABC):
         Returns:
             bool: True if the connection was successful, False otherwise.
         """
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = self.logger
         with self._lock:
             self._state = TransportState.CONNECTING
 
@@ -224,7 +230,7 @@ class OBDTransport(ABC):
 
     def disconnect(self) -> None:
         """Close the connection to the OBD device."""
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = self.logger
         self._shutdown.set()
         with self._lock:
             self._discard_handle_locked()
@@ -241,7 +247,7 @@ class OBDTransport(ABC):
         Returns:
             Optional[str]: The response from the device, or None if the command failed.
         """
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = self.logger
         # Capture ONCE, before the receive loop. Re-capturing per
         # iteration would reintroduce the window this closes.
         handle = self._acquire_handle()
@@ -321,7 +327,7 @@ class OBDTransport(ABC):
         Args:
             retry_delay: Delay in seconds between retry attempts.
         """
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = self.logger
         while not self._shutdown.is_set():
             if self.connect():
                 return
@@ -81,6 +81,10 @@ class DisplayManager:
         self.logger = logging.getLogger('DisplayManager')
         self.thread_manager = thread_manager
         self.config_path = config_path
+        # Last mapping written by _save_config. Several paths save
+        # twice in succession (settings "save" then change_mode), so an
+        # unchanged mapping is not rewritten to the SD card.
+        self._persisted_config = None
         self._shutdown_event = threading.Event()
         self.terminal_restorer = terminal_restorer
         self._sim_mode = False  # Session-only simulation mode flag
@@ -618,8 +622,15 @@ class DisplayManager:
                 'engine_profile': self.config.engine_profile,
                 'palette': self._palette.name,
             }
-            with open(self.config_path, 'w') as f:
+            if config_data == self._persisted_config:
+                return
+            # Write beside the target and rename over it, so power loss
+            # mid-write leaves the previous file rather than a torn one.
+            tmp_path = f"{self.config_path}.tmp"
+            with open(tmp_path, 'w') as f:
                 yaml.dump(config_data, f)
+            os.replace(tmp_path, self.config_path)
+            self._persisted_config = config_data
 
         except Exception as e:
             self.logger.error(f"Config save failed: {e}")
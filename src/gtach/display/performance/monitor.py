@@ -19,6 +19,7 @@ import logging
 import os
 import psutil
 from collections import deque, defaultdict
+from itertools import islice
 from typing import Dict, Any, Optional, List, Tuple
 import pygame
 
@@ -82,7 +83,7 @@ class PerformanceMonitor(PerformanceMonitorInterface):
         self._last_metrics_update = 0.0
         
         # Dirty regions tracking (for optimization)
-        self._dirty_regions = []
+        self._dirty_regions = deque(maxlen=100)
         self._total_dirty_area = 0
         
         # Font cache integration
@@ -384,30 +385,31 @@ class PerformanceMonitor(PerformanceMonitorInterface):
     def is_performance_acceptable(self) -> bool:
         """Check if current performance meets acceptable thresholds"""
         try:
-            metrics = self.get_current_metrics()
-            
-            # Check FPS threshold
-            if metrics.fps < self.thresholds['min_fps']:
-                return False
-            
-            # Check frame time threshold
-            if metrics.frame_time_ms > self.thresholds['max_frame_time_ms']:
-                return False
-            
-            # Check memory threshold
-            if metrics.memory_usage_mb > self.thresholds['max_memory_mb']:
-                return False
-            
-            # Check cache hit rate threshold (if cache is active)
-            if (metrics.cache_hit_rate > 0 and 
-                metrics.cache_hit_rate < self.thresholds['min_cache_hit_rate']):
-                return False
-            
-            return True
-            
+            return self._meets_thresholds(self.get_current_metrics())
         except Exception as e:
             self.logger.error(f"Error checking performance: {e}")
             return False
+
+    def _meets_thresholds(self, metrics: PerformanceMetrics) -> bool:
+        """Check a metrics snapshot against the acceptable thresholds"""
+        # Check FPS threshold
+        if metrics.fps < self.thresholds['min_fps']:
+            return False
+        
+        # Check frame time threshold
+        if metrics.frame_time_ms > self.thresholds['max_frame_time_ms']:
+            return False
+        
+        # Check memory threshold
+        if metrics.memory_usage_mb > self.thresholds['max_memory_mb']:
+            return False
+        
+        # Check cache hit rate threshold (if cache is active)
+        if (metrics.cache_hit_rate > 0 and
+            metrics.cache_hit_rate < self.thresholds['min_cache_hit_rate']):
+            return False
+
+        return True
     
     def _calculate_current_fps(self) -> float:
         """Calculate current FPS from recent frame history"""
@@ -415,11 +417,17 @@ class PerformanceMonitor(PerformanceMonitorInterface):
             if not self._frame_history:
                 return 0.0
             
-            current_time = time.time()
-            recent_frames = [f for f in self._frame_history 
-                           if current_time - f['timestamp'] <= 1.0]
+            # Walk back from the newest frame and stop at the first one
+            # older than a second, rather than scanning the whole
+            # ten-second history each time.
+            cutoff_time = time.time() - 1.0
+            recent_count = 0
+            for f in reversed(self._frame_history):
+                if f['timestamp'] < cutoff_time:
+                    break
+                recent_count += 1
             
-            return len(recent_frames)
+            return recent_count
             
         except Exception:
             return 0.0
@@ -430,7 +438,8 @@ class PerformanceMonitor(PerformanceMonitorInterface):
             if not self._frame_history:
                 return 0.0
             
-            recent_frames = list(self._frame_history)[-30:]  # Last 30 frames
+            # Last 30 frames, without copying the whole history to a list
+            recent_frames = list(islice(reversed(self._frame_history), 30))
             total_time = sum(f['frame_time'] for f in recent_frames)
             
             return total_time / len(recent_frames)
@@ -477,8 +486,10 @@ class PerformanceMonitor(PerformanceMonitorInterface):
     def _calculate_cache_hit_rate(self) -> float:
         """Calculate overall cache hit rate"""
         try:
-            total_hits = sum(stats['hits'] for stats in self._cache_stats.values())
-            total_misses = sum(stats['misses'] for stats in self._cache_stats.values())
+            total_hits = total_misses = 0
+            for stats in self._cache_stats.values():
+                total_hits += stats['hits']
+                total_misses += stats['misses']
             total_requests = total_hits + total_misses
             
             if total_requests == 0:
@@ -505,6 +516,11 @@ class PerformanceMonitor(PerformanceMonitorInterface):
         
         with self._lock:
             try:
+                # Limit dirty region history. The deque evicts the
+                # oldest region on append; its area leaves the total here.
+                if len(self._dirty_regions) == self._dirty_regions.maxlen:
+                    self._total_dirty_area -= self._dirty_regions[0]['area']
+
                 self._dirty_regions.append({
                     'rect': rect,
                     'timestamp': time.time(),
@@ -512,11 +528,6 @@ class PerformanceMonitor(PerformanceMonitorInterface):
                 })
                 
                 self._total_dirty_area += rect.width * rect.height
-                
-                # Limit dirty region history
-                if len(self._dirty_regions) > 100:
-                    removed = self._dirty_regions.pop(0)
-                    self._total_dirty_area -= removed['area']
                     
             except Exception as e:
                 self.logger.error(f"Error adding dirty region: {e}")
@@ -552,7 +563,7 @@ class PerformanceMonitor(PerformanceMonitorInterface):
                 return {
                     'current_metrics': metrics.to_dict(),
                     'thresholds': dict(self.thresholds),
-                    'performance_acceptable': self.is_performance_acceptable(),
+                    'performance_acceptable': self._meets_thresholds(metrics),
                     'monitoring_duration': time.time() - self._start_time if self._monitoring else 0,
                     'cache_details': dict(self._cache_stats),
                     'operation_counts': dict(self._operation_counts),
@@ -192,7 +192,10 @@ class SetupDisplayManager:
                     if state.current_screen in self._screen_render_cache:
                         cached_surface = self._screen_render_cache[state.current_screen]
                         surface.blit(cached_surface, (0, 0))
-                        self.logger.debug(f"Using cached render for {state.current_screen.name}")
+                        # Cache hits are the per-frame steady state; skip
+                        # formatting the message unless DEBUG is on.
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Using cached render for {state.current_screen.name}")
                         self._update_cached_screen_touch_regions()
                         self._draw_circular_border(surface)
                         return
@@ -91,8 +91,11 @@ class TouchHandler:
             x = max(0, min(479, x))
             y = max(0, min(479, y))
             
-            # Log touch events for debugging
-            self.logger.debug(f"Touch event: {event.event_type.name} at ({x}, {y}) - normalized ({event.x:.3f}, {event.y:.3f})")
+            # Log touch events for debugging. Guarded because moves
+            # arrive at the panel's sample rate and the f-string is
+            # formatted whether or not DEBUG is enabled.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Touch event: {event.event_type.name} at ({x}, {y}) - normalized ({event.x:.3f}, {event.y:.3f})")
             
             # Convert TouchEventType to boolean state for existing logic
             if event.event_type == TouchEventType.TOUCH_DOWN:
@@ -15,6 +15,7 @@ import logging
 import time
 import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum, auto
 from typing import Optional, Callable, Any
 from dataclasses import dataclass
@@ -495,8 +496,9 @@ class MockTouchInterface(TouchInterface):
         if config:
             self._config.update(config)
         
-        # Event history for development debugging
-        self._event_history = []
+        # Event history for development debugging. Bounded, so the
+        # oldest event drops off as each new one is appended.
+        self._event_history = deque(maxlen=self._config['event_history_size'])
         
         # Touch statistics for development insights
         self._stats = {
@@ -551,6 +553,10 @@ class MockTouchInterface(TouchInterface):
             if key in self._config:
                 old_value = self._config[key]
                 self._config[key] = value
+                if key == 'event_history_size':
+                    # A deque's cap is fixed at construction; rebuild it
+                    # so the new size applies, keeping the newest events.
+                    self._event_history = deque(self._event_history, maxlen=value)
                 self.logger.debug(f"Config updated: {key} = {value} (was {old_value})")
             else:
                 self.logger.warning(f"Unknown configuration option: {key}")
@@ -764,11 +770,6 @@ class MockTouchInterface(TouchInterface):
             'y': event.y,
             'timestamp': event.timestamp
         })
-        
-        # Maintain history size limit
-        max_size = self._config['event_history_size']
-        if len(self._event_history) > max_size:
-            self._event_history = self._event_history[-max_size:]
     
     def _print_development_info(self) -> None:
         """Print helpful development information"""
@@ -184,11 +184,9 @@ class AcknowledgementStateManager:
                     f.flush()
                     os.fsync(f.fileno())
 
-                # Atomic rename
-                if os.name == 'nt':  # Windows
-                    if self.state_file_path.exists():
-                        self.state_file_path.unlink()
-                temp_path.rename(self.state_file_path)
+                # Atomic rename; os.replace overwrites on every
+                # platform, so no separate unlink is needed
+                os.replace(temp_path, self.state_file_path)
 
                 self.logger.debug(f"Acknowledgement state saved for profile '{profile_id}'")
                 return True
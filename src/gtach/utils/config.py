@@ -21,6 +21,7 @@ import uuid
 import time
 import weakref
 import importlib.resources
+from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any, Union, Callable
 from pathlib import Path
@@ -730,10 +731,10 @@ class SessionManager:
         Returns:
             Dictionary mapping session IDs to their log files
         """
-        session_files = {}
+        session_files = defaultdict(list)
         
         if not self.log_dir.exists():
-            return session_files
+            return dict(session_files)
         
         try:
             for log_file in self.log_dir.glob("*_*.log"):
@@ -755,14 +756,12 @@ class SessionManager:
                 
                 # Group files by session ID
                 if session_id:
-                    if session_id not in session_files:
-                        session_files[session_id] = []
                     session_files[session_id].append(log_file)
                         
         except Exception as e:
             print(f"Warning: Error listing session logs: {e}")
         
-        return session_files
+        return dict(session_files)
     
     def get_session_age_days(self, session_id: str) -> float:
         """Get the age of a session in days
@@ -841,9 +840,10 @@ class SessionManager:
         removed_count = 0
         for log_file in files:
             try:
-                if log_file.exists():
-                    log_file.unlink()
-                    removed_count += 1
+                log_file.unlink()
+                removed_count += 1
+            except FileNotFoundError:
+                continue  # Already gone; unlink is the existence check
             except (OSError, PermissionError) as e:
                 print(f"Warning: Could not remove log file {log_file}: {e}")
         
@@ -867,27 +867,29 @@ class SessionManager:
             session_archive_dir = self.archive_dir / session_id
             session_archive_dir.mkdir(exist_ok=True)
             
-            # Copy files to archive directory
+            # Move files into the archive directory
             archived_count = 0
             for log_file in files:
-                if log_file.exists():
-                    try:
-                        import shutil
-                        archive_path = session_archive_dir / log_file.name
-                        shutil.copy2(log_file, archive_path)
-                        
-                        # Optionally compress the file
-                        if self.session_config.archive_compression:
-                            self._compress_file(archive_path)
-                        
-                        # Remove original file after successful archive
-                        log_file.unlink()
-                        archived_count += 1
-                        
-                    except Exception as e:
-                        print(f"Warning: Could not archive file {log_file}: {e}")
-                        continue
-            
+                try:
+                    # shutil.move renames on the same filesystem, which
+                    # is the usual case with the archive under log_dir,
+                    # and falls back to copy-then-unlink if
+                    # archived_sessions is mounted elsewhere.
+                    import shutil
+                    archive_path = session_archive_dir / log_file.name
+                    shutil.move(str(log_file), archive_path)
+                except FileNotFoundError:
+                    continue  # Removed since the listing; nothing to archive
+                except Exception as e:
+                    print(f"Warning: Could not archive file {log_file}: {e}")
+                    continue
+
+                # Optionally compress the file
+                if self.session_config.archive_compression:
+                    self._compress_file(archive_path)
+
+                archived_count += 1
+
             # Create session metadata file
             self._create_session_metadata(session_archive_dir, session_id, archived_count)
             
@@ -912,9 +914,11 @@ class SessionManager:
             
             compressed_path = file_path.with_suffix(file_path.suffix + '.gz')
             
+            # 128 KiB per read rather than copyfileobj's 64 KiB default:
+            # half the read/compress round trips on multi-MB debug logs.
             with open(file_path, 'rb') as f_in:
                 with gzip.open(compressed_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    shutil.copyfileobj(f_in, f_out, 128 * 1024)
             
             # Remove original file after successful compression
             file_path.unlink()
@@ -968,16 +972,16 @@ class SessionManager:
             
             # Get all archived session directories
             archived_sessions = []
-            for session_dir in self.archive_dir.iterdir():
-                if session_dir.is_dir():
-                    # Extract session timestamp for sorting
-                    try:
-                        session_id = session_dir.name
-                        age_days = self.get_session_age_days(session_id)
-                        if age_days >= 0:
-                            archived_sessions.append((session_dir, age_days))
-                    except Exception:
-                        continue
+            with os.scandir(self.archive_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Extract session timestamp for sorting
+                        try:
+                            age_days = self.get_session_age_days(entry.name)
+                            if age_days >= 0:
+                                archived_sessions.append((Path(entry.path), age_days))
+                        except Exception:
+                            continue
             
             results["archives_processed"] = len(archived_sessions)
             
@@ -1035,7 +1039,8 @@ class SessionManager:
             
             # Count archived sessions
             if self.archive_dir.exists():
-                stats["archived_sessions"] = len([d for d in self.archive_dir.iterdir() if d.is_dir()])
+                with os.scandir(self.archive_dir) as entries:
+                    stats["archived_sessions"] = sum(1 for e in entries if e.is_dir())
             
             # Calculate disk usage
             stats["disk_usage_mb"] = self._calculate_disk_usage()
@@ -1052,19 +1057,28 @@ class SessionManager:
             Disk usage in megabytes
         """
         total_size = 0
-        
+
         try:
             # Calculate active session log sizes
             if self.log_dir.exists():
-                for log_file in self.log_dir.glob("*.log"):
-                    total_size += log_file.stat().st_size
-            
-            # Calculate archived session sizes
+                with os.scandir(self.log_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.log') and entry.is_file():
+                            total_size += entry.stat().st_size
+
+            # Calculate archived session sizes. DirEntry caches the type
+            # from the directory read, so one walk costs one stat per file
+            # rather than rglob's is_file() and stat() pair.
             if self.archive_dir.exists():
-                for archive_file in self.archive_dir.rglob("*"):
-                    if archive_file.is_file():
-                        total_size += archive_file.stat().st_size
-        
+                pending = [self.archive_dir]
+                while pending:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                total_size += entry.stat().st_size
+
         except Exception as e:
             print(f"Warning: Could not calculate disk usage: {e}")
         
@@ -1403,11 +1417,9 @@ class ConfigManager:
                     f.flush()  # Ensure data is written
                     os.fsync(f.fileno())  # Force filesystem sync
                     
-                # Atomic rename
-                if os.name == 'nt':  # Windows
-                    if os.path.exists(self.config_path):
-                        os.remove(self.config_path)
-                os.rename(temp_path, self.config_path)
+                # Atomic rename; os.replace overwrites on every
+                # platform, so no separate remove is needed
+                os.replace(temp_path, self.config_path)
                 
                 self.logger.debug(f"Configuration saved atomically to {self.config_path}")
                 return True
@@ -420,19 +420,29 @@ class DependencyValidator:
         if not self.reports:
             return {}
         
-        # Filter out skipped dependencies for cleaner summary
-        checked_reports = [r for r in self.reports if not (r.result == ValidationResult.SUCCESS and not r.available)]
-        
+        # One pass over the reports; skipped dependencies (SUCCESS but
+        # not available) are left out of the checked totals.
+        counts = {result: 0 for result in ValidationResult}
+        checked = available = skipped = 0
+        for r in self.reports:
+            counts[r.result] += 1
+            if r.result == ValidationResult.SUCCESS and not r.available:
+                skipped += 1
+                continue
+            checked += 1
+            if r.available:
+                available += 1
+
         summary = {
-            'total_checked': len(checked_reports),
-            'available': sum(1 for r in checked_reports if r.available),
-            'missing': sum(1 for r in checked_reports if not r.available),
-            'fatal_errors': sum(1 for r in self.reports if r.result == ValidationResult.FATAL),
-            'errors': sum(1 for r in self.reports if r.result == ValidationResult.ERROR),
-            'warnings': sum(1 for r in self.reports if r.result == ValidationResult.WARNING),
-            'success': sum(1 for r in self.reports if r.result == ValidationResult.SUCCESS and r.available),
-            'skipped': sum(1 for r in self.reports if r.result == ValidationResult.SUCCESS and not r.available),
-            'can_start': sum(1 for r in self.reports if r.result == ValidationResult.FATAL) == 0
+            'total_checked': checked,
+            'available': available,
+            'missing': checked - available,
+            'fatal_errors': counts[ValidationResult.FATAL],
+            'errors': counts[ValidationResult.ERROR],
+            'warnings': counts[ValidationResult.WARNING],
+            'success': counts[ValidationResult.SUCCESS] - skipped,
+            'skipped': skipped,
+            'can_start': counts[ValidationResult.FATAL] == 0
         }
         
         return summary
@@ -441,17 +451,23 @@ class DependencyValidator:
         """Print detailed dependency report"""
         if show_successful is None:
             show_successful = self.debug
+
+        # Collected and written in one call rather than one write per line
+        lines: List[str] = []
+
+        def out(line: str = "") -> None:
+            lines.append(line)
         
-        print("\n" + "="*70)
-        print("OBDII Display Application - Dependency Validation Report")
-        print("="*70)
+        out("\n" + "="*70)
+        out("OBDII Display Application - Dependency Validation Report")
+        out("="*70)
         
         # Platform information
-        print(f"Platform: {self.platform_info['system']} {self.platform_info['machine']}")
-        print(f"Python: {self.platform_info['python_version']}")
-        print(f"Raspberry Pi: {'Yes' if self.platform_info['is_raspberry_pi'] else 'No'}")
-        print(f"Development Mode: {'Yes' if self.platform_info['is_development'] else 'No'}")
-        print()
+        out(f"Platform: {self.platform_info['system']} {self.platform_info['machine']}")
+        out(f"Python: {self.platform_info['python_version']}")
+        out(f"Raspberry Pi: {'Yes' if self.platform_info['is_raspberry_pi'] else 'No'}")
+        out(f"Development Mode: {'Yes' if self.platform_info['is_development'] else 'No'}")
+        out()
         
         # Group reports by result type
         fatal_reports = [r for r in self.reports if r.result == ValidationResult.FATAL]
@@ -462,76 +478,77 @@ class DependencyValidator:
         
         # Print fatal errors
         if fatal_reports:
-            print("❌ FATAL ERRORS (Application cannot start):")
+            out("❌ FATAL ERRORS (Application cannot start):")
             for report in fatal_reports:
-                print(f"  • {report.name}: {report.error_message}")
+                out(f"  • {report.name}: {report.error_message}")
                 if report.install_command:
-                    print(f"    Install: {report.install_command}")
+                    out(f"    Install: {report.install_command}")
                 if report.dependency_info.description:
-                    print(f"    Purpose: {report.dependency_info.description}")
-                print()
+                    out(f"    Purpose: {report.dependency_info.description}")
+                out()
         
         # Print errors
         if error_reports:
-            print("🟡 ERRORS (Reduced functionality):")
+            out("🟡 ERRORS (Reduced functionality):")
             for report in error_reports:
-                print(f"  • {report.name}: {report.error_message}")
+                out(f"  • {report.name}: {report.error_message}")
                 if report.install_command:
-                    print(f"    Install: {report.install_command}")
+                    out(f"    Install: {report.install_command}")
                 if report.dependency_info.description:
-                    print(f"    Purpose: {report.dependency_info.description}")
-                print()
+                    out(f"    Purpose: {report.dependency_info.description}")
+                out()
         
         # Print warnings
         if warning_reports:
-            print("⚠️  WARNINGS (Optional features unavailable):")
+            out("⚠️  WARNINGS (Optional features unavailable):")
             for report in warning_reports:
-                print(f"  • {report.name}: {report.error_message}")
+                out(f"  • {report.name}: {report.error_message}")
                 if report.install_command:
-                    print(f"    Install: {report.install_command}")
+                    out(f"    Install: {report.install_command}")
                 if report.dependency_info.description:
-                    print(f"    Purpose: {report.dependency_info.description}")
-                print()
+                    out(f"    Purpose: {report.dependency_info.description}")
+                out()
         
         # Print successful dependencies
         if show_successful and success_reports:
-            print("✅ AVAILABLE DEPENDENCIES:")
+            out("✅ AVAILABLE DEPENDENCIES:")
             for report in success_reports:
                 version_str = f" (v{report.version})" if report.version else ""
-                print(f"  • {report.name}{version_str}")
+                out(f"  • {report.name}{version_str}")
                 if self.debug and report.dependency_info.description:
-                    print(f"    Purpose: {report.dependency_info.description}")
-            print()
+                    out(f"    Purpose: {report.dependency_info.description}")
+            out()
         
         # Print skipped dependencies in debug mode
         if self.debug and skipped_reports:
-            print("⏭️  SKIPPED DEPENDENCIES (Not required for current platform):")
+            out("⏭️  SKIPPED DEPENDENCIES (Not required for current platform):")
             for report in skipped_reports:
-                print(f"  • {report.name}: {report.error_message}")
+                out(f"  • {report.name}: {report.error_message}")
                 if report.dependency_info.description:
-                    print(f"    Purpose: {report.dependency_info.description}")
-            print()
+                    out(f"    Purpose: {report.dependency_info.description}")
+            out()
         
         # Print summary
         summary = self.get_summary()
-        print("📊 SUMMARY:")
-        print(f"  Total Dependencies Checked: {summary['total_checked']}")
-        print(f"  Available: {summary['available']}")
-        print(f"  Missing: {summary['missing']}")
-        print(f"  Fatal Errors: {summary['fatal_errors']}")
-        print(f"  Errors: {summary['errors']}")
-        print(f"  Warnings: {summary['warnings']}")
+        out("📊 SUMMARY:")
+        out(f"  Total Dependencies Checked: {summary['total_checked']}")
+        out(f"  Available: {summary['available']}")
+        out(f"  Missing: {summary['missing']}")
+        out(f"  Fatal Errors: {summary['fatal_errors']}")
+        out(f"  Errors: {summary['errors']}")
+        out(f"  Warnings: {summary['warnings']}")
         if self.debug and summary.get('skipped', 0) > 0:
-            print(f"  Skipped (Platform-specific): {summary['skipped']}")
-        print()
+            out(f"  Skipped (Platform-specific): {summary['skipped']}")
+        out()
         
         # Final status
         if summary['can_start']:
-            print("✅ Application can start (all critical dependencies available)")
+            out("✅ Application can start (all critical dependencies available)")
         else:
-            print("❌ Application cannot start (missing critical dependencies)")
+            out("❌ Application cannot start (missing critical dependencies)")
         
-        print("="*70)
+        out("="*70)
+        print("\n".join(lines))
     
     def get_install_commands(self) -> List[str]:
         """Get installation commands for missing dependencies"""
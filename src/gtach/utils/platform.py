@@ -80,7 +80,7 @@ class MockRegistry:
     def __init__(self):
         self.logger = logging.getLogger('MockRegistry')
         self._mocks: Dict[str, Any] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # Every method is a leaf; none re-enters
     
     def register_mock(self, module_name: str, mock_instance: Any) -> None:
         """Register a mock for a module"""
@@ -536,12 +536,12 @@ class PlatformDetector:
             return PlatformType.UNKNOWN
         
         # Find platform with highest score
-        best_platform = max(platform_scores.items(), key=lambda x: x[1])
+        best_platform = max(platform_scores, key=platform_scores.__getitem__)
         
         self.logger.debug(f"Platform scoring results: {dict(platform_scores)}")
-        self.logger.debug(f"Selected platform: {best_platform[0].name} (score: {best_platform[1]:.2f})")
+        self.logger.debug(f"Selected platform: {best_platform.name} (score: {platform_scores[best_platform]:.2f})")
         
-        return best_platform[0]
+        return best_platform
     
     def check_gpio_availability(self, force_refresh: bool = False) -> PlatformCapabilities:
         """
@@ -79,12 +79,14 @@ def find_available_update() -> Optional[Tuple[str, str]]:
             ver = parse_wheel_version(name)
             if ver is None or ver <= installed:
                 continue
+            # Compare against the running best before validating:
+            # validate_wheel CRC-checks every member of the archive.
+            if best is not None and ver <= best[0]:
+                continue
             if not validate_wheel(os.path.join(UPDATES_DIR, name)):
                 logger.warning(f"Skipping invalid wheel: {name}")
                 continue
-            raw = name.split("-")[1]
-            if best is None or ver > best[0]:
-                best = (ver, name, raw)
+            best = (ver, name, name.split("-")[1])
         if best is None:
             return None
         return (best[1], best[2])